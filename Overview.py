@@ -17,9 +17,18 @@ st.set_page_config(
 )
 
 
-@st.cache_resource
+SUMMARY_METRICS = (
+    ("Parts", "parts"),
+    ("Suppliers", "suppliers"),
+    ("Quotes", "quotes"),
+    ("Tariff rows", "tariffs"),
+    ("NPI gates", "npi_gates"),
+)
+
+
+@st.cache_resource(show_spinner=False)
 def _load() -> Catalog:
-    return Catalog.load()
+    return Catalog.load(snapshot=True)
 
 
 c = _load()
@@ -32,12 +41,8 @@ st.caption(
 )
 
 s = c.summary()
-m1, m2, m3, m4, m5 = st.columns(5)
-m1.metric("Parts", s["parts"])
-m2.metric("Suppliers", s["suppliers"])
-m3.metric("Quotes", s["quotes"])
-m4.metric("Tariff rows", s["tariffs"])
-m5.metric("NPI gates", s["npi_gates"])
+for col, (label, key) in zip(st.columns(len(SUMMARY_METRICS)), SUMMARY_METRICS):
+    col.metric(label, s[key])
 
 st.markdown("---")
 st.subheader("What each module does")
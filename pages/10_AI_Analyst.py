@@ -4,8 +4,8 @@ from __future__ import annotations
 import pandas as pd
 import streamlit as st
 
-from sourcing.ai.anomaly import detect
-from sourcing.ai.briefing import generate
+from sourcing.ai.anomaly import Anomaly, detect
+from sourcing.ai.briefing import Briefing, generate
 from sourcing.ai.nl_query import query
 from sourcing.data.catalog import Catalog
 from sourcing.engine.optimizer import (
@@ -19,9 +19,35 @@ from sourcing.engine.tco import TCOInputs
 st.set_page_config(page_title="AI Sourcing Analyst", layout="wide")
 
 
-@st.cache_resource
+@st.cache_resource(show_spinner=False)
 def _load() -> Catalog:
-    return Catalog.load()
+    return Catalog.load(snapshot=True)
+
+
+# Both are deterministic in their inputs; cache so tab switches and unrelated
+# widget changes don't re-run the detector or re-solve the MILP.
+@st.cache_data(max_entries=128, show_spinner=False)
+def _anomalies(_catalog: Catalog, z_threshold: float) -> list[Anomaly]:
+    return detect(_catalog, z_threshold=z_threshold)
+
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _briefings(_catalog: Catalog, part_id: str, volume: int) -> list[Briefing]:
+    options = build_supplier_options(
+        _catalog, part_id, TCOInputs(volume=volume, carbon_shadow_usd_per_tonne=50)
+    )
+    res = solve_allocation(
+        options,
+        OptimizerInputs(
+            annual_volume=volume,
+            w_cost=1.0,
+            w_risk=0.2,
+            w_carbon=0.1,
+            max_country_share=0.7,
+            min_num_suppliers=2,
+        ),
+    )
+    return generate(_catalog, part_id, res)
 
 
 c = _load()
@@ -63,7 +89,7 @@ with tabs[1]:
         "Peer-set z-threshold (how many σ from peer mean before we flag)",
         1.0, 3.0, 1.5, step=0.1,
     )
-    anomalies = detect(c, z_threshold=z)
+    anomalies = _anomalies(c, z)
     if not anomalies:
         st.success("No anomalies above threshold.")
     else:
@@ -92,23 +118,11 @@ with tabs[2]:
     )
     part_id = st.selectbox(
         "Part",
-        options=list(c.parts.keys()),
+        options=c.part_ids,
         format_func=lambda p: c.parts[p].name,
     )
     volume = st.number_input("Annual volume", 10_000, 200_000_000, 10_000_000, step=100_000)
-    options = build_supplier_options(c, part_id, TCOInputs(volume=int(volume), carbon_shadow_usd_per_tonne=50))
-    res = solve_allocation(
-        options,
-        OptimizerInputs(
-            annual_volume=int(volume),
-            w_cost=1.0,
-            w_risk=0.2,
-            w_carbon=0.1,
-            max_country_share=0.7,
-            min_num_suppliers=2,
-        ),
-    )
-    briefings = generate(c, part_id, res)
+    briefings = _briefings(c, part_id, int(volume))
     for b in briefings:
         with st.expander(b.persona, expanded=True):
             st.markdown(b.markdown)
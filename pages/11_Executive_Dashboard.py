@@ -15,9 +15,34 @@ from sourcing.ui_fmt import usd
 st.set_page_config(page_title="Executive Dashboard", layout="wide")
 
 
-@st.cache_resource
+@st.cache_resource(show_spinner=False)
 def _load() -> Catalog:
-    return Catalog.load()
+    return Catalog.load(snapshot=True)
+
+
+_REFERENCE_VOLUME = 5_000_000
+
+
+@st.cache_data(show_spinner=False)
+def _tco_surface(_catalog: Catalog, volume: int) -> pd.DataFrame:
+    """Landed TCO for every quote at its best mode — one row per quote, NaN if unpriceable."""
+    inputs = TCOInputs(volume=volume)
+    rows = []
+    for q in _catalog.quotes:
+        mode = pick_best_mode(_catalog, q)
+        try:
+            total = compute_tco(_catalog, q, mode, inputs).total
+        except Exception:
+            total = float("nan")
+        rows.append(
+            {
+                "part_id": q.part_id,
+                "supplier_id": q.supplier_id,
+                "country": _catalog.suppliers[q.supplier_id].country,
+                "tco": total,
+            }
+        )
+    return pd.DataFrame(rows)
 
 
 c = _load()
@@ -29,38 +54,24 @@ st.markdown(
 )
 
 # --- Portfolio TCO (lowest-cost per part across available suppliers) ---
-rows = []
-for part_id, part in c.parts.items():
-    qs = c.quotes_for(part_id)
-    if not qs:
-        continue
-    best = None
-    best_tco = float("inf")
-    best_country = ""
-    for q in qs:
-        sup = c.suppliers[q.supplier_id]
-        mode = pick_best_mode(c, q)
-        try:
-            b = compute_tco(c, q, mode, TCOInputs(volume=5_000_000))
-        except Exception:
-            continue
-        if b.total < best_tco:
-            best_tco = b.total
-            best = q
-            best_country = sup.country
-    if best is not None:
-        rows.append(
-            {
-                "Part": part.name,
-                "Category": part.category,
-                "Best supplier": c.suppliers[best.supplier_id].name,
-                "Best country": best_country,
-                "Best TCO": best_tco,
-                "Num quotes": len(qs),
-                "Countries covered": len({c.suppliers[q.supplier_id].country for q in qs}),
-            }
-        )
-df = pd.DataFrame(rows)
+surface = _tco_surface(c, _REFERENCE_VOLUME)
+coverage = surface.groupby("part_id").agg(
+    quotes=("supplier_id", "size"), countries=("country", "nunique")
+)
+priced = surface.dropna(subset=["tco"])
+best = priced.loc[priced.groupby("part_id")["tco"].idxmin()].set_index("part_id")
+best = best.loc[[p for p in c.part_ids if p in best.index]]
+df = pd.DataFrame(
+    {
+        "Part": [c.parts[p].name for p in best.index],
+        "Category": [c.parts[p].category for p in best.index],
+        "Best supplier": [c.suppliers[s].name for s in best["supplier_id"]],
+        "Best country": best["country"].to_list(),
+        "Best TCO": best["tco"].to_list(),
+        "Num quotes": coverage.loc[best.index, "quotes"].to_list(),
+        "Countries covered": coverage.loc[best.index, "countries"].to_list(),
+    }
+)
 
 k1, k2, k3, k4 = st.columns(4)
 k1.metric("Parts tracked", len(df))
@@ -1,21 +1,52 @@
 """Wave 0/1 — N-way Portfolio Comparator."""
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
 from sourcing.data.catalog import Catalog
-from sourcing.engine.tco import TCOInputs, compute_tco, pick_best_mode
+from sourcing.engine.tco import POSITIVE_LINES, TCOInputs, compute_tco, pick_best_mode
 from sourcing.ui_fmt import usd
 
 
 st.set_page_config(page_title="Portfolio Comparator", layout="wide")
 
-
-@st.cache_resource
+# Static table / chart settings — built once per process, not on every rerun.
+_TABLE_FORMAT = {
+    "FOB": "${:,.2f}",
+    "Freight+Ins": "${:,.2f}",
+    "Duties": "${:,.2f}",
+    "Inventory": "${:,.2f}",
+    "NRE/Unit": "${:,.2f}",
+    "Yield Loss": "${:,.2f}",
+    "Carbon": "${:,.2f}",
+    "FX Adj": "${:,.2f}",
+    "DPO Benefit": "${:,.2f}",
+    "TCO": "${:,.2f}",
+    "vs Best": "${:,.2f}",
+    "LeadWk": "{:.1f}",
+    "Capacity/mo": "{:,}",
+}
+_STACK_LAYOUT = dict(barmode="stack", height=480, legend_title_text="Cost line")
+_LINE_LABELS = np.array(POSITIVE_LINES)
+_ALL_LINES = np.arange(len(POSITIVE_LINES))
+_NO_FOB_LINES = _ALL_LINES[1:]  # FOB is always the first cost line
+
+
+@st.cache_resource(show_spinner=False)
 def _load() -> Catalog:
-    return Catalog.load()
+    return Catalog.load(snapshot=True)
+
+
+def _cost_structure_fig(
+    suppliers: list[str], lines: list[str], columns: np.ndarray
+) -> go.Figure:
+    return go.Figure(
+        data=[go.Bar(name=cat, x=suppliers, y=col) for cat, col in zip(lines, columns)],
+        layout=_STACK_LAYOUT,
+    )
 
 
 c = _load()
@@ -43,7 +74,7 @@ left, right = st.columns([1, 2])
 with left:
     part_id = st.selectbox(
         "Part",
-        options=list(c.parts.keys()),
+        options=c.part_ids,
         format_func=lambda p: f"{c.parts[p].name} ({p})",
         help="Pick the part you're sourcing.",
     )
@@ -112,7 +143,7 @@ inputs = TCOInputs(
 
 
 rows: list[dict] = []
-breakdowns: dict[str, dict[str, float]] = {}
+breakdowns: dict[str, list[float]] = {}
 for q in quotes:
     if q.supplier_id not in picked:
         continue
@@ -138,7 +169,7 @@ for q in quotes:
             "Capacity/mo": q.capacity_monthly,
         }
     )
-    breakdowns[sup.name] = b.positive_lines()
+    breakdowns[sup.name] = list(b.positive_lines().values())
 
 if not rows:
     st.info("Pick at least one supplier.")
@@ -150,23 +181,7 @@ df["vs Best"] = df["TCO"] - best["TCO"]
 
 st.subheader("Landed TCO Ranking (lowest-cost first)")
 st.dataframe(
-    df.style.format(
-        {
-            "FOB": "${:,.2f}",
-            "Freight+Ins": "${:,.2f}",
-            "Duties": "${:,.2f}",
-            "Inventory": "${:,.2f}",
-            "NRE/Unit": "${:,.2f}",
-            "Yield Loss": "${:,.2f}",
-            "Carbon": "${:,.2f}",
-            "FX Adj": "${:,.2f}",
-            "DPO Benefit": "${:,.2f}",
-            "TCO": "${:,.2f}",
-            "vs Best": "${:,.2f}",
-            "LeadWk": "{:.1f}",
-            "Capacity/mo": "{:,}",
-        }
-    ),
+    df.style.format(_TABLE_FORMAT),
     hide_index=True,
     use_container_width=True,
     column_config={
@@ -177,36 +192,14 @@ st.dataframe(
 )
 
 st.subheader("Cost Structure (Stacked)")
-cat_order = [
-    "FOB",
-    "Freight",
-    "Insurance",
-    "Base Duty",
-    "Section 301",
-    "Section 232",
-    "AD/CVD",
-    "Inventory Carry",
-    "NRE Amort.",
-    "Yield Loss",
-    "Warranty Reserve",
-    "Carbon Shadow",
-    "FX Adjustment",
-]
 exclude_fob = st.checkbox(
     "Focus View — hide FOB so the smaller deltas are visible",
     value=True,
     help="FOB usually dominates the bar; hiding it lets duties / freight / yield stand out.",
 )
-shown = [x for x in cat_order if not (exclude_fob and x == "FOB")]
-
-fig = go.Figure()
-for cat in shown:
-    fig.add_bar(
-        name=cat,
-        x=list(breakdowns.keys()),
-        y=[breakdowns[s].get(cat, 0.0) for s in breakdowns.keys()],
-    )
-fig.update_layout(barmode="stack", height=480, legend_title_text="Cost line")
+idx = _NO_FOB_LINES if exclude_fob else _ALL_LINES
+matrix = np.array(list(breakdowns.values()))  # suppliers × cost lines
+fig = _cost_structure_fig(list(breakdowns), _LINE_LABELS[idx].tolist(), matrix[:, idx].T)
 st.plotly_chart(fig, use_container_width=True)
 
 st.subheader("Quick Read")
@@ -18,9 +18,9 @@ from sourcing.ui_fmt import usd
 st.set_page_config(page_title="Award-Split Optimizer", layout="wide")
 
 
-@st.cache_resource
+@st.cache_resource(show_spinner=False)
 def _load() -> Catalog:
-    return Catalog.load()
+    return Catalog.load(snapshot=True)
 
 
 c = _load()
@@ -81,7 +81,7 @@ left, right = st.columns([1, 1])
 with left:
     part_id = st.selectbox(
         "Part",
-        options=list(c.parts.keys()),
+        options=c.part_ids,
         format_func=lambda p: f"{c.parts[p].name} ({p})",
         index=0,
     )
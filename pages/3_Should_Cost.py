@@ -12,9 +12,9 @@ from sourcing.ui_fmt import usd
 st.set_page_config(page_title="Should-Cost", layout="wide")
 
 
-@st.cache_resource
+@st.cache_resource(show_spinner=False)
 def _load() -> Catalog:
-    return Catalog.load()
+    return Catalog.load(snapshot=True)
 
 
 c = _load()
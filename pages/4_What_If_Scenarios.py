@@ -19,9 +19,9 @@ from sourcing.ui_fmt import usd
 st.set_page_config(page_title="What-If Scenarios", layout="wide")
 
 
-@st.cache_resource
+@st.cache_resource(show_spinner=False)
 def _load() -> Catalog:
-    return Catalog.load()
+    return Catalog.load(snapshot=True)
 
 
 c = _load()
@@ -36,7 +36,7 @@ left, right = st.columns([1, 1])
 with left:
     part_id = st.selectbox(
         "Part",
-        options=list(c.parts.keys()),
+        options=c.part_ids,
         format_func=lambda p: f"{c.parts[p].name} ({p})",
     )
     quotes = c.quotes_for(part_id)
@@ -175,11 +175,14 @@ with tabs[3]:
     )
     mc = MonteCarloInputs(trials=int(trials))
     res = run_monte_carlo(c, quote, mode, base_inputs, mc)
-    m1, m2, m3, m4 = st.columns(4)
-    m1.metric("Base (deterministic)", usd(res.base_tco))
-    m2.metric("P50 (median)", usd(res.p50))
-    m3.metric("P90 (stress budget)", usd(res.p90))
-    m4.metric("P95 (value-at-risk)", usd(res.p95))
+    percentiles = (
+        ("Base (deterministic)", res.base_tco),
+        ("P50 (median)", res.p50),
+        ("P90 (stress budget)", res.p90),
+        ("P95 (value-at-risk)", res.p95),
+    )
+    for col, (label, value) in zip(st.columns(len(percentiles)), percentiles):
+        col.metric(label, usd(value))
     k1, k2 = st.columns(2)
     k1.metric("Mean ± stdev", f"{usd(res.mean)} ± {usd(res.std)}")
     k2.metric("Expedite-triggered trials", f"{res.expedite_hits_pct:.1%}")
@@ -14,9 +14,9 @@ from sourcing.engine.npi_planner import critical_path_slack, plan_program
 st.set_page_config(page_title="NPI Backward Planner", layout="wide")
 
 
-@st.cache_resource
+@st.cache_resource(show_spinner=False)
 def _load() -> Catalog:
-    return Catalog.load()
+    return Catalog.load(snapshot=True)
 
 
 c = _load()
@@ -13,9 +13,9 @@ from sourcing.ui_fmt import usd
 st.set_page_config(page_title="Sustaining Ops", layout="wide")
 
 
-@st.cache_resource
+@st.cache_resource(show_spinner=False)
 def _load() -> Catalog:
-    return Catalog.load()
+    return Catalog.load(snapshot=True)
 
 
 c = _load()
@@ -73,7 +73,7 @@ with tabs[1]:
     )
     part_id = st.selectbox(
         "Affected part",
-        options=list(c.parts.keys()),
+        options=c.part_ids,
         format_func=lambda p: c.parts[p].name,
     )
     base_quote = st.selectbox(
@@ -141,7 +141,7 @@ with tabs[2]:
     )
     part_id = st.selectbox(
         "Legacy part",
-        options=list(c.parts.keys()),
+        options=c.part_ids,
         format_func=lambda p: c.parts[p].name,
         key="ltb_part",
     )
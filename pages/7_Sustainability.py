@@ -14,9 +14,9 @@ from sourcing.ui_fmt import usd
 st.set_page_config(page_title="Sustainability", layout="wide")
 
 
-@st.cache_resource
+@st.cache_resource(show_spinner=False)
 def _load() -> Catalog:
-    return Catalog.load()
+    return Catalog.load(snapshot=True)
 
 
 c = _load()
@@ -42,7 +42,7 @@ with st.expander("Scope 1 / 2 / 3 in plain English — open if new"):
 
 part_id = st.selectbox(
     "Part",
-    options=list(c.parts.keys()),
+    options=c.part_ids,
     format_func=lambda p: c.parts[p].name,
 )
 
@@ -11,9 +11,9 @@ from sourcing.engine.trade import evaluate_fta
 st.set_page_config(page_title="Trade Compliance", layout="wide")
 
 
-@st.cache_resource
+@st.cache_resource(show_spinner=False)
 def _load() -> Catalog:
-    return Catalog.load()
+    return Catalog.load(snapshot=True)
 
 
 c = _load()
@@ -50,7 +50,7 @@ with tabs[0]:
     )
     part_id = st.selectbox(
         "Part",
-        options=list(c.parts.keys()),
+        options=c.part_ids,
         format_func=lambda p: c.parts[p].name,
     )
     quotes = c.quotes_for(part_id)
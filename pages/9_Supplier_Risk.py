@@ -12,9 +12,9 @@ from sourcing.engine.risk import score_supplier
 st.set_page_config(page_title="Supplier Risk", layout="wide")
 
 
-@st.cache_resource
+@st.cache_resource(show_spinner=False)
 def _load() -> Catalog:
-    return Catalog.load()
+    return Catalog.load(snapshot=True)
 
 
 c = _load()
@@ -22,33 +22,33 @@ class Anomaly:
 def detect(catalog: Catalog, z_threshold: float = 1.5) -> List[Anomaly]:
     anomalies: List[Anomaly] = []
 
-    # Group quotes by part, compute z of FOB within peer set.
-    rows = []
-    for q in catalog.quotes:
-        rows.append({"part_id": q.part_id, "supplier_id": q.supplier_id, "fob": q.fob_usd})
-    df = pd.DataFrame(rows)
-    for part_id, grp in df.groupby("part_id"):
-        if len(grp) < 2:
-            continue
-        mu = grp["fob"].mean()
-        sd = grp["fob"].std(ddof=0)
-        if sd == 0 or pd.isna(sd):
-            continue
-        for _, r in grp.iterrows():
-            z = (r["fob"] - mu) / sd
-            if abs(z) >= z_threshold:
-                anomalies.append(
-                    Anomaly(
-                        part_id=r["part_id"],
-                        supplier_id=r["supplier_id"],
-                        kind="peer-fob-outlier",
-                        severity=abs(z),
-                        message=(
-                            f"FOB ${r['fob']:.2f} is {z:+.1f}σ vs peer set "
-                            f"(mean ${mu:.2f}, σ ${sd:.2f})."
-                        ),
-                    )
-                )
+    # z of FOB within each part's peer set, computed column-wise in one pass.
+    df = pd.DataFrame(
+        {
+            "part_id": [q.part_id for q in catalog.quotes],
+            "supplier_id": [q.supplier_id for q in catalog.quotes],
+            "fob": [q.fob_usd for q in catalog.quotes],
+        }
+    )
+    fob = df.groupby("part_id")["fob"]
+    df["n"] = fob.transform("size")
+    df["mu"] = fob.transform("mean")
+    df["sd"] = fob.transform("std", ddof=0)
+    df["z"] = (df["fob"] - df["mu"]) / df["sd"]
+    flagged = df[(df["n"] >= 2) & (df["sd"] > 0) & (df["z"].abs() >= z_threshold)]
+    for r in flagged.sort_values("part_id", kind="stable").itertuples(index=False):
+        anomalies.append(
+            Anomaly(
+                part_id=r.part_id,
+                supplier_id=r.supplier_id,
+                kind="peer-fob-outlier",
+                severity=abs(r.z),
+                message=(
+                    f"FOB ${r.fob:.2f} is {r.z:+.1f}σ vs peer set "
+                    f"(mean ${r.mu:.2f}, σ ${r.sd:.2f})."
+                ),
+            )
+        )
 
     # Quote vs should-cost variance on assemblies — only run where a BOM exists,
     # otherwise a labor-only should-cost makes the variance meaningless.
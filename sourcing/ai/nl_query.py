@@ -22,6 +22,10 @@ import pandas as pd
 from sourcing.data.catalog import Catalog
 
 
+_FAMILIES = ("iphone", "macbook", "ipad", "watch", "airpod")
+_ORIGINS = ("China", "Vietnam", "India", "Mexico", "Thailand", "Taiwan")
+
+
 @dataclass(frozen=True)
 class QueryResult:
     echo: str
@@ -83,16 +87,17 @@ def _flat_table(catalog: Catalog) -> pd.DataFrame:
 
 
 def query(catalog: Catalog, text: str) -> QueryResult:
-    df = _flat_table(catalog)
+    full = _flat_table(catalog)
+    df = full
     t = text.lower()
     filters: List[str] = []
 
-    for fam in ["iphone", "macbook", "ipad", "watch", "airpod"]:
+    for fam in _FAMILIES:
         if fam in t:
             df = df[df["Family"].str.lower().str.contains(fam)]
             filters.append(f"family={fam}")
 
-    for country in ["China", "Vietnam", "India", "Mexico", "Thailand", "Taiwan"]:
+    for country in _ORIGINS:
         if country.lower() in t:
             df = df[df["Origin"] == country]
             filters.append(f"origin={country}")
@@ -149,7 +154,7 @@ def query(catalog: Catalog, text: str) -> QueryResult:
         filters.append(f"carbon {op} {val}")
 
     if "single-source" in t or "single source" in t or "single sourced" in t:
-        part_counts = _flat_table(catalog).groupby("PartID").size()
+        part_counts = full.groupby("PartID").size()
         single = set(part_counts[part_counts < 2].index)
         df = df[df["PartID"].isin(single)]
         filters.append("single-source parts")
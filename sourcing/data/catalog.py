@@ -1,6 +1,10 @@
 """Catalog: one-stop loader for all seed data, returned as immutable dataclasses."""
 from __future__ import annotations
 
+import hashlib
+import os
+import pickle
+import tempfile
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from pathlib import Path
@@ -25,12 +29,28 @@ from sourcing.domain import (
 )
 
 _DATA_DIR = Path(__file__).parent
+_DOMAIN_DIR = _DATA_DIR.parent / "domain"
+_SNAPSHOT_DIR = ".cache"
 
 
 def _parse_date(value: str) -> date:
     return datetime.strptime(str(value), "%Y-%m-%d").date()
 
 
+def _snapshot_key(data_dir: Path) -> str:
+    """Fingerprint of the seed CSVs plus the code that shapes them into dataclasses.
+
+    Any edited CSV, catalog.py or domain module changes the key, so a stale
+    snapshot is never served after a data refresh or a schema change.
+    """
+    sources = sorted(data_dir.glob("*.csv")) + [Path(__file__)] + sorted(_DOMAIN_DIR.glob("*.py"))
+    h = hashlib.sha1()
+    for f in sources:
+        stat = f.stat()
+        h.update(f"{f.name}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return h.hexdigest()[:16]
+
+
 @dataclass(frozen=True)
 class Wage:
     country: str
@@ -66,11 +86,65 @@ class Catalog:
     npi_gates: List[NPIGate]
     wages: Dict[str, Wage]
     labor: Dict[str, LaborHours]
+    part_ids: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _quotes_by_part: Dict[str, List[Quote]] = field(init=False, repr=False, compare=False)
+    _lanes_by_key: Dict[Tuple[str, str, str], LogisticsLane] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Pages look up quotes for the selected part on every rerun; index once.
+        quotes_by_part: Dict[str, List[Quote]] = {}
+        for q in self.quotes:
+            quotes_by_part.setdefault(q.part_id, []).append(q)
+        object.__setattr__(self, "_quotes_by_part", quotes_by_part)
+        # Freight lookups run per quote per mode; first row wins, as in a linear scan.
+        lanes_by_key: Dict[Tuple[str, str, str], LogisticsLane] = {}
+        for ln in self.lanes:
+            lanes_by_key.setdefault((ln.origin_country, ln.destination_country, ln.mode), ln)
+        object.__setattr__(self, "_lanes_by_key", lanes_by_key)
+        # Static selectbox options — built once rather than list(parts) per rerun.
+        object.__setattr__(self, "part_ids", tuple(self.parts))
 
     @staticmethod
-    def load(data_dir: Optional[Path] = None) -> "Catalog":
+    def load(data_dir: Optional[Path] = None, snapshot: bool = False) -> "Catalog":
+        """Load the catalog from the seed CSVs.
+
+        With `snapshot=True` the parsed catalog is pickled under `<data_dir>/.cache/`
+        and reused on later cold starts until any input file changes.
+        """
         d = Path(data_dir) if data_dir else _DATA_DIR
+        if not snapshot:
+            return Catalog._from_csv(d)
+
+        path = d / _SNAPSHOT_DIR / f"catalog-{_snapshot_key(d)}.pkl"
+        try:
+            with path.open("rb") as fh:
+                return pickle.load(fh)
+        except (OSError, EOFError, AttributeError, pickle.UnpicklingError):
+            pass
+        catalog = Catalog._from_csv(d)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            # Pages load concurrently on first boot: each writer gets its own temp
+            # file and publishes it atomically, so readers never see a partial write.
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    pickle.dump(catalog, fh, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+            for old in path.parent.glob("catalog-*.pkl"):
+                if old.name != path.name:
+                    old.unlink(missing_ok=True)
+        except OSError:
+            pass  # read-only deploy: fall back to parsing CSVs each cold start
+        return catalog
 
+    @staticmethod
+    def _from_csv(d: Path) -> "Catalog":
         parts_df = pd.read_csv(d / "parts.csv")
         parts = {
             r.id: Part(
@@ -311,7 +385,7 @@ class Catalog:
         )
 
     def quotes_for(self, part_id: str) -> List[Quote]:
-        return [q for q in self.quotes if q.part_id == part_id]
+        return list(self._quotes_by_part.get(part_id, ()))
 
     def tariff_for(
         self, hts_code: str, origin: str, destination: str
@@ -338,14 +412,7 @@ class Catalog:
     def lane_for(
         self, origin: str, destination: str, mode: str
     ) -> Optional[LogisticsLane]:
-        for ln in self.lanes:
-            if (
-                ln.origin_country == origin
-                and ln.destination_country == destination
-                and ln.mode == mode
-            ):
-                return ln
-        return None
+        return self._lanes_by_key.get((origin, destination, mode))
 
     def summary(self) -> Dict[str, int]:
         return {
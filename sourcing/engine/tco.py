@@ -33,6 +33,26 @@ class TCOInputs:
     fx_stress_pct: float = 0.0
 
 
+# Display label -> TCOBreakdown field for the additive cost lines, in display
+# order; FOB is always first.
+_POSITIVE_LINE_FIELDS = (
+    ("FOB", "fob"),
+    ("Freight", "freight"),
+    ("Insurance", "insurance"),
+    ("Base Duty", "base_duty"),
+    ("Section 301", "section_301"),
+    ("Section 232", "section_232"),
+    ("AD/CVD", "adcvd"),
+    ("Inventory Carry", "inventory_carrying"),
+    ("NRE Amort.", "nre_per_unit"),
+    ("Yield Loss", "yield_loss"),
+    ("Warranty Reserve", "warranty_reserve"),
+    ("Carbon Shadow", "carbon_shadow"),
+    ("FX Adjustment", "fx_adjustment"),
+)
+POSITIVE_LINES = tuple(label for label, _ in _POSITIVE_LINE_FIELDS)
+
+
 @dataclass(frozen=True)
 class TCOBreakdown:
     fob: float
@@ -56,21 +76,7 @@ class TCOBreakdown:
         return asdict(self)
 
     def positive_lines(self) -> Dict[str, float]:
-        return {
-            "FOB": self.fob,
-            "Freight": self.freight,
-            "Insurance": self.insurance,
-            "Base Duty": self.base_duty,
-            "Section 301": self.section_301,
-            "Section 232": self.section_232,
-            "AD/CVD": self.adcvd,
-            "Inventory Carry": self.inventory_carrying,
-            "NRE Amort.": self.nre_per_unit,
-            "Yield Loss": self.yield_loss,
-            "Warranty Reserve": self.warranty_reserve,
-            "Carbon Shadow": self.carbon_shadow,
-            "FX Adjustment": self.fx_adjustment,
-        }
+        return {label: getattr(self, f) for label, f in _POSITIVE_LINE_FIELDS}
 
 
 def _freight_and_insurance(
@@ -1,3 +1,5 @@
+from dataclasses import replace
+
 from sourcing.ai.anomaly import detect
 from sourcing.ai.briefing import PERSONAS, generate
 from sourcing.ai.nl_query import query
@@ -44,6 +46,46 @@ def test_anomaly_detector_returns_records():
     assert isinstance(items, list)
 
 
+def _peer_outliers(catalog, z_threshold):
+    return [
+        (a.part_id, a.supplier_id, a.message)
+        for a in detect(catalog, z_threshold=z_threshold)
+        if a.kind == "peer-fob-outlier"
+    ]
+
+
+def test_anomaly_detector_peer_fob_outliers_seed():
+    c = Catalog.load()
+    assert _peer_outliers(c, 1.5) == [
+        (
+            "P_IPH15P",
+            "S_FOXCONN_MX",
+            "FOB $478.00 is +1.8σ vs peer set (mean $460.57, σ $9.77).",
+        ),
+    ]
+
+
+def test_anomaly_detector_skips_flat_and_single_quote_peer_sets():
+    c = Catalog.load()
+    flat = [replace(q, fob_usd=10.0) for q in c.quotes_for("P_BAT")[:2]]  # σ = 0
+    single = c.quotes_for("P_USBC")[:1]  # no peers
+    oled = c.quotes_for("P_OLED61")[:2]
+    spread = [replace(q, fob_usd=fob) for q, fob in zip(oled, (4.0, 6.0))]
+    c = replace(c, quotes=flat + single + spread)
+    assert _peer_outliers(c, 0.5) == [
+        (
+            "P_OLED61",
+            oled[0].supplier_id,
+            "FOB $4.00 is -1.0σ vs peer set (mean $5.00, σ $1.00).",
+        ),
+        (
+            "P_OLED61",
+            oled[1].supplier_id,
+            "FOB $6.00 is +1.0σ vs peer set (mean $5.00, σ $1.00).",
+        ),
+    ]
+
+
 def test_anomaly_detector_skips_parts_without_bom():
     """Should-cost variance only meaningful for parts with a real BOM rollup."""
     c = Catalog.load()
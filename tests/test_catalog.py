@@ -1,4 +1,9 @@
-from sourcing.data.catalog import Catalog
+import pickle
+import shutil
+
+import pytest
+
+from sourcing.data.catalog import _DATA_DIR, Catalog
 
 
 def test_catalog_loads():
@@ -36,3 +41,53 @@ def test_all_quotes_reference_valid_ids():
         assert q.part_id in c.parts
         assert q.supplier_id in c.suppliers
         assert q.site_id in c.sites
+
+
+def test_quotes_for_matches_full_scan():
+    c = Catalog.load()
+    for part_id in c.parts:
+        assert c.quotes_for(part_id) == [q for q in c.quotes if q.part_id == part_id]
+    assert c.quotes_for("P_DOES_NOT_EXIST") == []
+
+
+def test_lane_for_returns_first_matching_row():
+    c = Catalog.load()
+    for ln in c.lanes:
+        first = next(
+            x
+            for x in c.lanes
+            if (x.origin_country, x.destination_country, x.mode)
+            == (ln.origin_country, ln.destination_country, ln.mode)
+        )
+        assert c.lane_for(ln.origin_country, ln.destination_country, ln.mode) is first
+    assert c.lane_for("China", "USA", "Teleport") is None
+
+
+def test_snapshot_roundtrip_and_invalidation(tmp_path):
+    for f in _DATA_DIR.glob("*.csv"):
+        shutil.copy(f, tmp_path / f.name)
+    fresh = Catalog.load(tmp_path, snapshot=True)
+    assert len(list((tmp_path / ".cache").glob("catalog-*.pkl"))) == 1
+    warm = Catalog.load(tmp_path, snapshot=True)
+    assert warm == fresh == Catalog.load(tmp_path)
+    assert warm.quotes_for("P_IPH15P") == fresh.quotes_for("P_IPH15P")
+
+    with (tmp_path / "fx.csv").open("a") as fh:
+        fh.write("XYZ,1.0,1.0,1.0,0.0,2026-04-01,Test\n")
+    assert "XYZ" in Catalog.load(tmp_path, snapshot=True).fx
+    assert len(list((tmp_path / ".cache").glob("catalog-*.pkl"))) == 1
+
+
+@pytest.mark.parametrize("damage", ["truncate", "garbage"])
+def test_corrupt_snapshot_falls_back_to_csv_and_is_rewritten(tmp_path, damage):
+    for f in _DATA_DIR.glob("*.csv"):
+        shutil.copy(f, tmp_path / f.name)
+    Catalog.load(tmp_path, snapshot=True)
+    (snap,) = (tmp_path / ".cache").glob("catalog-*.pkl")
+    data = snap.read_bytes()
+    snap.write_bytes(data[: len(data) // 2] if damage == "truncate" else b"not a pickle")
+
+    fresh = Catalog.load(tmp_path)
+    assert Catalog.load(tmp_path, snapshot=True) == fresh
+    assert pickle.loads(snap.read_bytes()) == fresh
+    assert list((tmp_path / ".cache").glob("*.tmp")) == []
@@ -1,7 +1,9 @@
+from dataclasses import replace
+
 import pytest
 
 from sourcing.data.catalog import Catalog
-from sourcing.engine.tco import TCOInputs, compute_tco
+from sourcing.engine.tco import POSITIVE_LINES, TCOInputs, compute_tco, pick_best_mode
 
 
 @pytest.fixture(scope="module")
@@ -72,3 +74,45 @@ def test_yield_loss_nonzero_for_known_supplier(catalog):
     q = _first_quote(catalog, "P_IPH15P", "S_WISTRON_IN")
     b = compute_tco(catalog, q, "Ocean")
     assert b.yield_loss > 0
+
+
+def test_positive_lines_follow_display_order(catalog):
+    q = _first_quote(catalog, "P_IPH15P", "S_FOXCONN")
+    b = compute_tco(catalog, q, "Ocean", TCOInputs(carbon_shadow_usd_per_tonne=100))
+    lines = b.positive_lines()
+    assert list(lines) == list(POSITIVE_LINES)
+    assert lines["FOB"] == b.fob
+    assert lines["Freight"] == b.freight
+    assert lines["Carbon Shadow"] == b.carbon_shadow
+
+
+def _with_lanes(catalog, origin, destination, modes):
+    """Copy of the catalog whose origin -> destination lanes are exactly `modes`."""
+    template = catalog.lanes[0]
+    lanes = [
+        ln
+        for ln in catalog.lanes
+        if (ln.origin_country, ln.destination_country) != (origin, destination)
+    ]
+    lanes += [
+        replace(template, origin_country=origin, destination_country=destination, mode=m)
+        for m in modes
+    ]
+    return replace(catalog, lanes=lanes)
+
+
+@pytest.mark.parametrize(
+    "part_id, supplier_id, order",
+    [
+        ("P_OLED61", "S_LUXSHARE", ("Truck", "Ocean", "Air")),  # China -> China
+        ("P_IPH15P", "S_FOXCONN", ("Ocean", "Truck", "Air")),  # China -> USA
+    ],
+)
+def test_pick_best_mode_search_order(catalog, part_id, supplier_id, order):
+    q = _first_quote(catalog, part_id, supplier_id)
+    origin = catalog.suppliers[supplier_id].country
+    for i, expected in enumerate(order):
+        c = _with_lanes(catalog, origin, q.destination_country, order[i:])
+        assert pick_best_mode(c, q) == expected
+    with pytest.raises(ValueError):
+        pick_best_mode(_with_lanes(catalog, origin, q.destination_country, ()), q)